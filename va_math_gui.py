@@ -1,5 +1,19 @@
 import sys
-from typing import List, Tuple, Dict
+from array import array
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Tuple, Dict, Sequence
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to plain Python
+    np = None
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
 
 from PyQt6.QtWidgets import (
     QApplication,
@@ -17,56 +31,127 @@ from PyQt6.QtWidgets import (
 )
 
 
-def va_combined_rating_detailed(ratings: List[float]) -> Tuple[int, List[Dict]]:
+STEP_FIELDS = (
+    "rating",
+    "remaining_before",
+    "added",
+    "combined_before_round",
+    "combined_after_round",
+)
+
+
+def _new_column(n: int) -> Sequence[float]:
+    """Allocate a zeroed float64 column of length n for the combining kernel."""
+    if np is not None:
+        return np.zeros(n, dtype=np.float64)
+    return array("d", bytes(8 * n))
+
+
+@njit(cache=True)
+def _combine_kernel(
+    sorted_desc,
+    remaining_before,
+    added,
+    combined_before_round,
+    combined_after_round,
+):
     """
-    Calculate VA combined disability rating and return detailed steps.
+    Apply VA math to ratings sorted high to low.
 
-    Args:
-        ratings: List of individual ratings (e.g. [50, 30, 10])
+    Per-step intermediates are written into the pre-allocated output columns.
+    Compiled with Numba when it is installed.
 
     Returns:
         final_rating: final combined rating rounded to nearest 10
-        steps: list of dicts with per-step breakdown
     """
-    if not ratings:
-        return 0, []
+    combined = 0.0
+
+    for i in range(len(sorted_desc)):
+        remaining = 100.0 - combined
+        add = remaining * (sorted_desc[i] / 100.0)
+
+        before_round_combined = combined + add
+        combined = float(round(before_round_combined))
+
+        remaining_before[i] = remaining
+        added[i] = add
+        combined_before_round[i] = before_round_combined
+        combined_after_round[i] = combined
+
+        # Nothing is left to add once fully combined; fill the remaining
+        # steps with their known values and stop
+        if combined >= 100.0:
+            for j in range(i + 1, len(sorted_desc)):
+                remaining_before[j] = 0.0
+                added[j] = 0.0
+                combined_before_round[j] = combined
+                combined_after_round[j] = combined
+            break
+
+    # Final rounding to nearest 10 (5 rounds up), clamped between 0 and 100
+    return min(100, max(0, ((int(combined) + 5) // 10) * 10))
+
+
+@lru_cache(maxsize=128)
+def _combine_cached(
+    sorted_ratings: Tuple[float, ...],
+) -> Tuple[int, Tuple[Tuple[float, ...], ...]]:
+    """
+    Run the combining kernel for ratings already sorted high to low.
 
-    clean_ratings = sorted(
-        [float(r) for r in ratings if 0 < float(r) <= 100],
-        reverse=True,
+    Results are memoized, so repeating a calculation with unchanged ratings
+    is a dictionary lookup. Step columns are returned as tuples so cached
+    results cannot be modified by callers.
+    """
+    n = len(sorted_ratings)
+    sorted_desc = np.asarray(sorted_ratings, dtype=np.float64) if np is not None else sorted_ratings
+    remaining_before = _new_column(n)
+    added = _new_column(n)
+    combined_before_round = _new_column(n)
+    combined_after_round = _new_column(n)
+
+    final = _combine_kernel(
+        sorted_desc,
+        remaining_before,
+        added,
+        combined_before_round,
+        combined_after_round,
     )
-    if not clean_ratings:
-        return 0, []
 
-    combined = 0.0
-    steps = []
+    columns = (
+        sorted_ratings,
+        tuple(remaining_before.tolist()),
+        tuple(added.tolist()),
+        tuple(combined_before_round.tolist()),
+        tuple(combined_after_round.tolist()),
+    )
 
-    for r in clean_ratings:
-        remaining = 100.0 - combined
-        added = remaining * (r / 100.0)
+    return int(final), columns
 
-        before_round_combined = combined + added
-        combined = round(before_round_combined)
 
-        steps.append({
-            "rating": r,
-            "remaining_before": remaining,
-            "added": added,
-            "combined_before_round": before_round_combined,
-            "combined_after_round": combined,
-        })
+def va_combined_rating_detailed(ratings: List[float]) -> Tuple[int, Dict[str, Sequence[float]]]:
+    """
+    Calculate VA combined disability rating and return detailed steps.
 
-    # Clamp between 0 and 100
-    combined = min(100, max(0, int(round(combined))))
+    Args:
+        ratings: List of individual ratings (e.g. [50, 30, 10])
+
+    Returns:
+        final_rating: final combined rating rounded to nearest 10
+        steps: per-step breakdown as parallel columns keyed by "rating",
+            "remaining_before", "added", "combined_before_round" and
+            "combined_after_round"
+    """
+    clean_ratings = tuple(
+        sorted(
+            [float(r) for r in ratings if 0 < float(r) <= 100],
+            reverse=True,
+        )
+    )
 
-    # Final rounding to nearest 10 (5 rounds up)
-    remainder = combined % 10
-    if remainder >= 5:
-        final = combined + (10 - remainder)
-    else:
-        final = combined - remainder
+    final, columns = _combine_cached(clean_ratings)
 
-    return int(final), steps
+    return final, dict(zip(STEP_FIELDS, columns))
 
 
 class VaMathApp(QWidget):
@@ -75,6 +160,10 @@ class VaMathApp(QWidget):
         self.setWindowTitle("VA Combined Rating Calculator")
         self.resize(700, 500)
 
+        # (condition name, rating) per table row, so calculating never
+        # has to read back and re-parse the table cells
+        self._rows: List[Tuple[str, float]] = []
+
         self._build_ui()
 
     def _build_ui(self):
@@ -104,6 +193,7 @@ class VaMathApp(QWidget):
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        self.table.itemChanged.connect(self.on_item_changed)
         main_layout.addWidget(self.table)
 
         # --- Buttons under table ---
@@ -161,9 +251,12 @@ class VaMathApp(QWidget):
             name = f"Condition {self.table.rowCount() + 1}"
 
         row = self.table.rowCount()
+        self._rows.append((name, rating))
+        self.table.blockSignals(True)
         self.table.insertRow(row)
         self.table.setItem(row, 0, QTableWidgetItem(name))
         self.table.setItem(row, 1, QTableWidgetItem(str(rating)))
+        self.table.blockSignals(False)
 
         # Clear inputs
         self.condition_input.clear()
@@ -178,77 +271,108 @@ class VaMathApp(QWidget):
 
         for row in rows:
             self.table.removeRow(row)
+            del self._rows[row]
 
     def clear_all(self):
         self.table.setRowCount(0)
+        self._rows.clear()
+        _combine_cached.cache_clear()
         self.result_label.setText("Combined Rating: -- %")
         self.details_box.clear()
 
+    def on_item_changed(self, item: QTableWidgetItem):
+        """Keep the cached rows in sync with edits made directly in the table."""
+        row = item.row()
+        if row >= len(self._rows):
+            return
+
+        condition_name, rating = self._rows[row]
+
+        if item.column() == 0:
+            self._rows[row] = (item.text(), rating)
+            return
+
+        rating_text = item.text().strip()
+
+        try:
+            new_rating = float(rating_text)
+        except ValueError:
+            QMessageBox.warning(
+                self,
+                "Data Error",
+                f"Invalid rating in row {row + 1}: '{rating_text}'",
+            )
+            self._restore_rating_text(item, rating)
+            return
+
+        if new_rating <= 0 or new_rating > 100:
+            QMessageBox.warning(
+                self,
+                "Data Error",
+                f"Rating in row {row + 1} must be between 0 and 100.",
+            )
+            self._restore_rating_text(item, rating)
+            return
+
+        self._rows[row] = (condition_name, new_rating)
+
+    def _restore_rating_text(self, item: QTableWidgetItem, rating: float):
+        self.table.blockSignals(True)
+        item.setText(str(rating))
+        self.table.blockSignals(False)
+
     def calculate_rating(self):
-        ratings = []
-        conditions = []
-
-        for row in range(self.table.rowCount()):
-            condition_item = self.table.item(row, 0)
-            rating_item = self.table.item(row, 1)
-
-            if rating_item is None:
-                continue
-
-            condition_name = condition_item.text() if condition_item else f"Condition {row + 1}"
-            rating_text = rating_item.text().strip()
-
-            try:
-                rating = float(rating_text)
-            except ValueError:
-                QMessageBox.warning(
-                    self,
-                    "Data Error",
-                    f"Invalid rating in row {row + 1}: '{rating_text}'",
-                )
-                return
-
-            if rating <= 0 or rating > 100:
-                QMessageBox.warning(
-                    self,
-                    "Data Error",
-                    f"Rating in row {row + 1} must be between 0 and 100.",
-                )
-                return
-
-            conditions.append((condition_name, rating))
-            ratings.append(rating)
-
-        if not ratings:
+        if not self._rows:
             QMessageBox.information(self, "No Data", "Please add at least one condition.")
             return
 
+        conditions = sorted(self._rows, key=itemgetter(1), reverse=True)
+        ratings = [r for _, r in conditions]
+
         final_rating, steps = va_combined_rating_detailed(ratings)
 
         # Update main result label
         self.result_label.setText(f"Combined Rating: {final_rating} %")
 
+        # The breakdown is only worth formatting if someone can see it
+        if not self.details_box.isVisible():
+            self.details_box.clear()
+            return
+
         # Build a nice readable step-by-step breakdown
-        details_lines = []
+        details_lines = ["Conditions (sorted by rating):"]
 
         # Show sorted conditions with ratings
-        details_lines.append("Conditions (sorted by rating):")
-        for name, r in sorted(conditions, key=lambda x: x[1], reverse=True):
-            details_lines.append(f"  - {name}: {r:.0f}%")
+        details_lines.extend(f"  - {name}: {r:.0f}%" for name, r in conditions)
         details_lines.append("")
 
         details_lines.append("Calculation Steps:")
-        for idx, step in enumerate(steps, start=1):
-            details_lines.append(f"Step {idx}: {step['rating']:.0f}% condition")
-            details_lines.append(f"  Remaining before: {step['remaining_before']:.2f}%")
-            details_lines.append(f"  Added: {step['added']:.2f}%")
-            details_lines.append(f"  Combined before round: {step['combined_before_round']:.2f}%")
-            details_lines.append(f"  Combined after round: {step['combined_after_round']}%")
-            details_lines.append("")
+        details_lines.extend(
+            f"Step {idx}: {r:.0f}% condition\n"
+            f"  Remaining before: {rem:.2f}%\n"
+            f"  Added: {add:.2f}%\n"
+            f"  Combined before round: {before:.2f}%\n"
+            f"  Combined after round: {after:.0f}%\n"
+            for idx, (r, rem, add, before, after) in enumerate(
+                zip(
+                    steps["rating"],
+                    steps["remaining_before"],
+                    steps["added"],
+                    steps["combined_before_round"],
+                    steps["combined_after_round"],
+                ),
+                start=1,
+            )
+        )
 
         details_lines.append(f"Final VA combined rating (rounded to nearest 10): {final_rating}%")
 
-        self.details_box.setPlainText("\n".join(details_lines))
+        # Batch the text edit's relayout into a single repaint
+        self.details_box.setUpdatesEnabled(False)
+        try:
+            self.details_box.setPlainText("\n".join(details_lines))
+        finally:
+            self.details_box.setUpdatesEnabled(True)
 
 
 def main():